@@ -54,18 +54,20 @@ class ListGenerator(DOEGenerator):
         List of collections of name, value pairs for the design variables.
     """
 
-    def __init__(self, data=[]):
+    def __init__(self, data=None):
         """
         Initialize the ListGenerator.
 
         Parameters
         ----------
-        data : list
+        data : list or None
             list of collections of name, value pairs for the design variables
         """
         super(ListGenerator, self).__init__()
 
-        if not isinstance(data, list):
+        if data is None:
+            data = []
+        elif not isinstance(data, list):
             msg = "Invalid DOE case data, expected a list but got a {}."
             raise RuntimeError(msg.format(data.__class__.__name__))
 
@@ -139,6 +139,44 @@ class TestBGSSolver(LinearSolverTests.LinearSolverTestCase):
 
         assert_near_equal(derivs[('sub.z', 'sub.z')], [[0., 1.]])
 
+    def test_complex_step_newton(self):
+        prob = om.Problem()
+        newton = om.NewtonSolver(solve_subsystems=False)
+        lgs = om.LinearBlockGS(maxiter=50, atol=1e-14, rtol=1e-14)
+        sub = prob.model.add_subsystem('sub', SellarDerivatives(nonlinear_solver=newton,
+                                                                linear_solver=lgs))
+        prob.model.approx_totals(method='cs')
+        prob.set_solver_print(level=0)
+
+        prob.setup()
+        prob.run_model()
+
+        # Newton's linear solves run under complex step here.
+        derivs = prob.compute_totals(of=['sub.obj'], wrt=['sub.z'])
+        assert_near_equal(derivs['sub.obj', 'sub.z'], [[9.61001056, 1.78448534]], .00001)
+
+        # the complex work vectors are released when complex step is turned off
+        self.assertIsNone(sub.linear_solver._scratch_vecs)
+        self.assertFalse(np.iscomplexobj(sub.linear_solver._rhs_vecs['linear']))
+
+        derivs = prob.compute_totals(of=['sub.obj'], wrt=['sub.z'])
+        assert_near_equal(derivs['sub.obj', 'sub.z'], [[9.61001056, 1.78448534]], .00001)
+
+    def test_scratch_vecs_lazy(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('sub', SellarDerivatives(linear_solver=om.LinearBlockGS()))
+        prob.setup()
+
+        # LinearRunOnce never computes a residual norm, so it gets no work vectors
+        self.assertIsNone(model.linear_solver._scratch_vecs)
+        self.assertIsNone(model.sub.linear_solver._scratch_vecs)
+
+        prob.run_model()
+        prob.compute_totals(of=['sub.obj'], wrt=['sub.z'])
+        self.assertIsNone(model.linear_solver._scratch_vecs)
+        self.assertEqual(len(model.sub.linear_solver._scratch_vecs), 1)
+
 
 class TestBGSSolverFeature(unittest.TestCase):
 
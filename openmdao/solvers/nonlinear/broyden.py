@@ -57,6 +57,9 @@ class BroydenSolver(NonlinearSolver):
         When True, Broyden considers the whole vector rather than a list of states.
     _recompute_jacobian : bool
         Flag that becomes True when Broyden detects it needs to recompute the inverse Jacobian.
+    _residuals_current : bool
+        Flag that is True when the residuals already match the current outputs, so the next
+        call to _run_apply can be skipped.
     """
 
     SOLVER = 'BROYDEN'
@@ -90,6 +93,7 @@ class BroydenSolver(NonlinearSolver):
         self.delta_fxm = None
         self._converge_failures = 0
         self._computed_jacobians = 0
+        self._residuals_current = False
 
         # This gets set to True if the user doesn't declare any states.
         self._full_inverse = False
@@ -307,6 +311,7 @@ class BroydenSolver(NonlinearSolver):
 
         self._converge_failures = 0
         self._computed_jacobians = 0
+        self._residuals_current = False
 
         # Execute guess_nonlinear if specified.
         system._guess_nonlinear()
@@ -334,6 +339,15 @@ class BroydenSolver(NonlinearSolver):
         norm0 = norm if norm != 0.0 else 1.0
         return norm0, norm
 
+    def _run_apply(self):
+        """
+        Run the apply_nonlinear method on the system, unless the residuals are already current.
+        """
+        if self._residuals_current:
+            self._residuals_current = False
+        else:
+            super(BroydenSolver, self)._run_apply()
+
     def _iter_get_norm(self):
         """
         Return the norm of only the residuals requested in options.
@@ -403,6 +417,10 @@ class BroydenSolver(NonlinearSolver):
 
         self._run_apply()
 
+        # The outputs don't change for the rest of this iteration, so the _run_apply that
+        # follows in the solver loop would only recompute the same residuals.
+        self._residuals_current = True
+
         fxm1 = fxm.copy()
         self.fxm = fxm = self.get_vector(system._residuals)
         delta_fxm = fxm - fxm1
@@ -131,9 +131,9 @@ class NonlinearBlockGS(NonlinearSolver):
             # store a copy of the outputs
             if not self.options['use_apply_nonlinear']:
                 with system._unscaled_context(outputs=[outputs]):
-                    outputs_n = outputs._data.copy()
+                    outputs_n = self._store_outputs_n()
             else:
-                outputs_n = outputs._data.copy()
+                outputs_n = self._store_outputs_n()
 
         self._solver_info.append_subsolver()
         self._gs_iter()
@@ -199,7 +199,7 @@ class NonlinearBlockGS(NonlinearSolver):
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
-                residuals._data[:] = outputs._data - outputs_n
+                np.subtract(outputs._data, outputs_n, out=residuals._data)
 
     def _run_apply(self):
         """
@@ -228,7 +228,7 @@ class NonlinearBlockGS(NonlinearSolver):
             residuals = system._residuals
 
             with system._unscaled_context(outputs=[outputs]):
-                outputs_n = outputs._data.copy()
+                outputs_n = self._store_outputs_n()
 
             self._solver_info.append_subsolver()
             for isub, (subsys, local) in enumerate(system._all_subsystem_iter()):
@@ -239,7 +239,7 @@ class NonlinearBlockGS(NonlinearSolver):
 
             self._solver_info.pop()
             with system._unscaled_context(residuals=[residuals]):
-                residuals._data[:] = outputs._data - outputs_n
+                np.subtract(outputs._data, outputs_n, out=residuals._data)
 
     def _mpi_print_header(self):
         """
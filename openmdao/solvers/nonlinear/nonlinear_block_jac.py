@@ -1,4 +1,6 @@
 """Define the NonlinearBlockJac class."""
+import numpy as np
+
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import multi_proc_fail_check
@@ -11,11 +13,31 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super(NonlinearBlockJac, self)._declare_options()
+
+        self.options.declare('use_apply_nonlinear', types=bool, default=True,
+                             desc="Set to True to always call apply_nonlinear on the solver's "
+                             "system after solve_nonlinear has been called. Unlike "
+                             "NonlinearBlockGS, this defaults to True; when False, the change in "
+                             "the outputs over an iteration is used as the residual.")
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
         """
         system = self._system()
+        outputs = system._outputs
+        use_apply_nonlinear = self.options['use_apply_nonlinear']
+
+        if not use_apply_nonlinear:
+            # store a copy of the outputs
+            with system._unscaled_context(outputs=[outputs]):
+                outputs_n = self._store_outputs_n()
+
         self._solver_info.append_subsolver()
         system._transfer('nonlinear', 'fwd')
 
@@ -36,6 +58,12 @@ class NonlinearBlockJac(NonlinearSolver):
 
         self._solver_info.pop()
 
+        if not use_apply_nonlinear:
+            # Residual is the change in the outputs vector.
+            residuals = system._residuals
+            with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
+                np.subtract(outputs._data, outputs_n, out=residuals._data)
+
     def _mpi_print_header(self):
         """
         Print header text before solving.
@@ -56,6 +84,11 @@ class NonlinearBlockJac(NonlinearSolver):
         """
         Run the apply_nonlinear method on the system.
         """
+        # The initial residual always comes from apply_nonlinear, since there is no previous
+        # iteration to compare the outputs against yet.
+        if not self.options['use_apply_nonlinear'] and self._iter_count > 0:
+            return
+
         system = self._system()
 
         # If this is a parallel group, check for analysis errors and reraise.
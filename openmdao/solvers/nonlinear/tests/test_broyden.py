@@ -210,6 +210,31 @@ class TestBryoden(unittest.TestCase):
         assert_near_equal(prob['y1'], 25.58830273, .00001)
         assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
 
+    def test_one_apply_per_iteration(self):
+        # The residuals computed at the end of each Broyden iteration are reused for the norm.
+
+        class CountApplySellar(SellarStateConnection):
+
+            def _apply_nonlinear(self):
+                self.apply_count += 1
+                super(CountApplySellar, self)._apply_nonlinear()
+
+        prob = om.Problem()
+        model = prob.model = CountApplySellar(nonlinear_solver=om.BroydenSolver(),
+                                              linear_solver=om.LinearRunOnce())
+        model.apply_count = 0
+
+        prob.setup()
+
+        model.nonlinear_solver.linesearch = None
+        model.nonlinear_solver.options['state_vars'] = ['state_eq.y2_command']
+        model.nonlinear_solver.options['compute_jacobian'] = False
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        self.assertEqual(model.apply_count, model.nonlinear_solver._iter_count + 1)
+
     def test_simple_sellar_cycle(self):
         # Test top level Sellar (i.e., not grouped).
 
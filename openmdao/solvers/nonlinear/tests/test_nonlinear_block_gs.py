@@ -407,6 +407,25 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_outputs_n_reuse(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        solver = prob.model.nonlinear_solver
+        outputs_n = solver._outputs_n
+        self.assertIsNotNone(outputs_n)
+
+        prob['x'] = 2.0
+        prob.run_model()
+
+        # the work array is reused rather than reallocated on each iteration and solve
+        self.assertIs(solver._outputs_n, outputs_n)
+        assert_near_equal(prob['y1'], 26.56909563, .00001)
+
     def test_res_ref(self):
 
         class ContrivedSellarDis1(SellarDis1):
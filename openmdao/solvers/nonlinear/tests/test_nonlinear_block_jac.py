@@ -152,6 +152,31 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y1'], 25.5886171567, .00001)
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
+    def test_no_apply_nonlinear(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+        nlbj = model.nonlinear_solver = om.NonlinearBlockJac()
+        nlbj.options['use_apply_nonlinear'] = False
+        nlbj.options['maxiter'] = 20
+
+        prob.setup()
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['y2'], 12.05848819, .00001)
+
+        # Only the initial residual comes from apply_nonlinear, so each discipline is
+        # executed once per iteration plus once up front.
+        self.assertEqual(model.d1.execution_count, nlbj._iter_count + 1)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
@@ -1,6 +1,7 @@
 """Define the base Solver, NonlinearSolver, and LinearSolver classes."""
 
 from collections import OrderedDict
+import math
 import os
 import pprint
 import re
@@ -138,6 +139,11 @@ class Solver(object):
         Normalization factor
     _solver_info : SolverInfo
         A stack-like object shared by all Solvers in the model.
+    _print_prefix : str or None
+        The SolverInfo prefix that _print_fmt was last built from.
+    _print_fmt : str
+        Cached format string (prefix, solver name and residual fields) for each iteration
+        line of iprint.
     """
 
     # Object to store some formatting for iprint that is shared across all solvers.
@@ -158,6 +164,8 @@ class Solver(object):
         self._mode = 'fwd'
         self._iter_count = 0
         self._solver_info = None
+        self._print_prefix = None
+        self._print_fmt = ''
 
         # Solver options
         self.options = OptionsDictionary(parent_name=self.msginfo)
@@ -345,15 +353,20 @@ class Solver(object):
         """
         if (self.options['iprint'] == 2 and self._system().comm.rank == 0):
 
+            # The prefix only changes when this solver is called at a different depth, so
+            # rebuild the format string only when it differs from the last call.
             prefix = self._solver_info.prefix
-            solver_name = self.SOLVER
+            if prefix != self._print_prefix:
+                solver_name = self.SOLVER
 
-            if prefix.endswith('precon:'):
-                solver_name = solver_name[3:]
+                if prefix.endswith('precon:'):
+                    solver_name = solver_name[3:]
 
-            print_str = prefix + solver_name
-            print_str += ' %d ; %.9g %.9g' % (iteration, abs_res, rel_res)
-            print(print_str)
+                self._print_prefix = prefix
+                head = (prefix + solver_name).replace('%', '%%')
+                self._print_fmt = head + ' %d ; %.9g %.9g'
+
+            print(self._print_fmt % (iteration, abs_res, rel_res))
 
     def _mpi_print_header(self):
         """
@@ -370,6 +383,9 @@ class Solver(object):
         rtol = self.options['rtol']
         iprint = self.options['iprint']
 
+        # _mpi_print checks iprint itself, but skip the call entirely when it won't print
+        print_iters = iprint == 2
+
         self._mpi_print_header()
 
         self._iter_count = 0
@@ -377,23 +393,28 @@ class Solver(object):
 
         self._norm0 = norm0
 
-        self._mpi_print(self._iter_count, norm, norm / norm0)
+        if norm0 == 0:
+            norm0 = 1
+        rel = norm / norm0
+
+        if print_iters:
+            self._mpi_print(self._iter_count, norm, rel)
 
-        while self._iter_count < maxiter and norm > atol and norm / norm0 > rtol:
+        while self._iter_count < maxiter and norm > atol and rel > rtol:
             with Recording(type(self).__name__, self._iter_count, self) as rec:
                 self._single_iteration()
                 self._iter_count += 1
                 self._run_apply()
                 norm = self._iter_get_norm()
+                rel = norm / norm0
                 # With solvers, we want to record the norm AFTER the call, but the call needs to
                 # be wrapped in the with for stack purposes, so we locally assign  norm & norm0
                 # into the class.
                 rec.abs = norm
-                if norm0 == 0:
-                    norm0 = 1
-                rec.rel = norm / norm0
+                rec.rel = rel
 
-            self._mpi_print(self._iter_count, norm, norm / norm0)
+            if print_iters:
+                self._mpi_print(self._iter_count, norm, rel)
 
         system = self._system()
         if system.comm.rank == 0 or os.environ.get('USE_PROC_FILES'):
@@ -401,7 +422,7 @@ class Solver(object):
 
             # Solver terminated early because a Nan in the norm doesn't satisfy the while-loop
             # conditionals.
-            if np.isinf(norm) or np.isnan(norm):
+            if not math.isfinite(norm):
                 msg = "Solver '{}' on system '{}': residuals contain 'inf' or 'NaN' after {} " + \
                       "iterations."
                 if iprint > -1:
@@ -414,7 +435,7 @@ class Solver(object):
                                                    self._iter_count))
 
             # Solver hit maxiter without meeting desired tolerances.
-            elif (norm > atol and norm / norm0 > rtol):
+            elif (norm > atol and rel > rtol):
                 msg = "Solver '{}' on system '{}' failed to converge in {} iterations."
 
                 if iprint > -1:
@@ -562,6 +583,8 @@ class NonlinearSolver(Solver):
     ----------
     _err_cache : dict
         Dictionary holding input and output vectors at start of iteration, if requested.
+    _outputs_n : ndarray or None
+        Work array holding a copy of the outputs from the start of an iteration.
     """
 
     def __init__(self, **kwargs):
@@ -575,6 +598,7 @@ class NonlinearSolver(Solver):
         """
         super(NonlinearSolver, self).__init__(**kwargs)
         self._err_cache = OrderedDict()
+        self._outputs_n = None
 
     def _declare_options(self):
         """
@@ -641,6 +665,27 @@ class NonlinearSolver(Solver):
         """
         return self._system()._residuals.get_norm()
 
+    def _store_outputs_n(self):
+        """
+        Copy the current outputs into a work array that is reused across iterations.
+
+        The array is only reallocated when the size or dtype of the outputs changes, e.g. when
+        switching in or out of complex step.
+
+        Returns
+        -------
+        ndarray
+            Copy of the current output data.
+        """
+        data = self._system()._outputs._data
+        outputs_n = self._outputs_n
+        if outputs_n is None or outputs_n.shape != data.shape or outputs_n.dtype != data.dtype:
+            self._outputs_n = outputs_n = data.copy()
+        else:
+            outputs_n[:] = data
+
+        return outputs_n
+
     def _disallow_discrete_outputs(self):
         """
         Raise an exception if any discrete outputs exist in our System.
@@ -793,8 +838,42 @@ class LinearSolver(Solver):
 class BlockLinearSolver(LinearSolver):
     """
     A base class for LinearBlockGS and LinearBlockJac.
+
+    Attributes
+    ----------
+    _rhs_vecs : dict
+        Copy of the right-hand-side data for each vec_name, taken at the start of each solve.
+    _scratch_vecs : list of <Vector> or None
+        Work vectors used to compute the residual norm, in _lin_rel_vec_name_list order.
+        Allocated on the first solve that computes a norm, and released when complex step
+        is toggled.
+    _b_vecs : list of <Vector>
+        The right-hand-side vectors for the current solve, in _lin_rel_vec_name_list order.
+    _rhs_list : list of ndarray
+        The arrays in _rhs_vecs for the current solve, in _lin_rel_vec_name_list order.
+    _vec_norms : ndarray or None
+        Work array holding the residual norm of each vec_name.
+    _single_vec : bool
+        True if there is only one vec_name, so its norm is the residual norm.
     """
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super(BlockLinearSolver, self).__init__(**kwargs)
+        self._rhs_vecs = {}
+        self._scratch_vecs = None
+        self._b_vecs = []
+        self._rhs_list = []
+        self._vec_norms = None
+        self._single_vec = False
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -819,20 +898,46 @@ class BlockLinearSolver(LinearSolver):
 
     def _create_rhs_vecs(self):
         self._rhs_vecs = rhs = {}
+        self._scratch_vecs = None
+        self._vec_norms = None
         system = self._system()
         for vec_name in system._lin_rel_vec_name_list:
             if self._mode == 'fwd':
-                rhs[vec_name] = system._vectors['residual'][vec_name]._data.copy()
+                b_vec = system._vectors['residual'][vec_name]
             else:
-                rhs[vec_name] = system._vectors['output'][vec_name]._data.copy()
+                b_vec = system._vectors['output'][vec_name]
+            rhs[vec_name] = b_vec._data.copy()
+
+    def _create_scratch_vecs(self):
+        """
+        Allocate the work vectors used to compute the residual norm without modifying b.
+        """
+        self._scratch_vecs = scratch = []
+        for b_vec in self._b_vecs:
+            # A clone made under complex step owns a copy of the complex data but starts
+            # out pointing at its real data, so switch it over.
+            vec = b_vec._clone()
+            if b_vec._under_complex_step:
+                vec.set_complex_step_mode(True)
+            scratch.append(vec)
+
+        self._vec_norms = np.empty(len(scratch))
+        self._single_vec = len(scratch) == 1
 
     def _update_rhs_vecs(self):
         system = self._system()
-        for vec_name in system._lin_rel_vec_name_list:
-            if self._mode == 'fwd':
-                self._rhs_vecs[vec_name][:] = system._vectors['residual'][vec_name]._data
-            else:
-                self._rhs_vecs[vec_name][:] = system._vectors['output'][vec_name]._data
+        if self._mode == 'fwd':
+            b_vecs = system._vectors['residual']
+        else:
+            b_vecs = system._vectors['output']
+
+        # resolve the rhs vectors once per solve so _iter_get_norm doesn't have to
+        vec_names = system._lin_rel_vec_name_list
+        self._b_vecs = [b_vecs[vec_name] for vec_name in vec_names]
+        self._rhs_list = [self._rhs_vecs[vec_name] for vec_name in vec_names]
+
+        for rhs, b_vec in zip(self._rhs_list, self._b_vecs):
+            rhs[:] = b_vec._data
 
     def _set_complex_step_mode(self, active):
         """
@@ -851,6 +956,11 @@ class BlockLinearSolver(LinearSolver):
             else:
                 self._rhs_vecs[vec_name] = self._rhs_vecs[vec_name].real
 
+        # Release the work vectors for the old mode. Ones for the new mode are made on the
+        # next solve that needs them.
+        self._scratch_vecs = None
+        self._vec_norms = None
+
     def _iter_initialize(self):
         """
         Perform any necessary pre-processing operations.
@@ -864,6 +974,8 @@ class BlockLinearSolver(LinearSolver):
         """
         self._update_rhs_vecs()
         if self.options['maxiter'] > 1:
+            if self._scratch_vecs is None:
+                self._create_scratch_vecs()
             self._run_apply()
             norm = self._iter_get_norm()
         else:
@@ -875,27 +987,23 @@ class BlockLinearSolver(LinearSolver):
         """
         Return the norm of the residual.
 
-        Note: This has the side effect of modifying the residual vector in fwd mode
-        and the output vector in rev mode.
-
         Returns
         -------
         float
             norm.
         """
-        system = self._system()
+        if self._single_vec:
+            scratch = self._scratch_vecs[0]
+            np.subtract(self._b_vecs[0]._data, self._rhs_list[0], out=scratch._data)
+            return scratch.get_norm()
 
-        if self._mode == 'fwd':
-            b_vecs = system._vectors['residual']
-        else:  # rev
-            b_vecs = system._vectors['output']
-
-        norm = 0
-        for vec_name in system._lin_rel_vec_name_list:
-            b_vecs[vec_name]._data -= self._rhs_vecs[vec_name]
-            norm += b_vecs[vec_name].get_norm()**2
+        vec_norms = self._vec_norms
+        for i, (b_vec, rhs, scratch) in enumerate(zip(self._b_vecs, self._rhs_list,
+                                                      self._scratch_vecs)):
+            np.subtract(b_vec._data, rhs, out=scratch._data)
+            vec_norms[i] = scratch.get_norm()
 
-        return norm ** 0.5
+        return np.linalg.norm(vec_norms)
 
     def solve(self, vec_names, mode, rel_systems=None):
         """
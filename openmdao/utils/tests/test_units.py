@@ -2,10 +2,14 @@
 
 import os
 import unittest
+from io import StringIO
+
+import numpy as np
 
 # from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.units import NumberDict, PhysicalUnit, _find_unit, import_library, \
-    add_unit, add_offset_unit, unit_conversion, get_conversion
+    add_unit, add_offset_unit, unit_conversion, get_conversion, convert_units, _CONVERSION_CACHE, \
+    _parse_unit_expr, update_library, valid_units, _UNIT_CACHE
 from openmdao.utils.assert_utils import assert_warning
 
 
@@ -113,6 +117,17 @@ class TestPhysicalUnit(unittest.TestCase):
         else:
             self.fail("Expecting TypeError")
 
+    def test_hash(self):
+        x = _find_unit('N*m')
+        y = _find_unit('J')
+        self.assertEqual(x, y)
+        self.assertEqual(hash(x), hash(y))
+        self.assertEqual(len({x, y, _find_unit('W')}), 2)
+
+        # units with the same dimensions share their powers
+        self.assertIs(x._powers, y._powers)
+        self.assertIs(_find_unit('ft')._powers, (_find_unit('m') * 3.0)._powers)
+
     known__mul__Values = (('1m', '5m', 5), ('1cm', '1cm', 1), ('1cm', '5m', 5),
                           ('7km', '1m', 7))
 
@@ -246,6 +261,18 @@ class TestPhysicalUnit(unittest.TestCase):
         y = x2 / (x1**2)
         self.assertEqual(y.name(), 'kg/m**2')
 
+    def test_in_base_units(self):
+        x = _find_unit('km/h')
+        base = x.in_base_units()
+        self.assertEqual(base.name(), 'm/s')
+        self.assertEqual(base._factor, 1.0)
+        self.assertIs(x.in_base_units(), base)
+
+        self.assertFalse(x.is_dimensionless())
+        self.assertFalse(x.is_angle())
+        self.assertTrue(_find_unit('deg').is_angle())
+        self.assertTrue(_find_unit('m/km').is_dimensionless())
+
     def test_unit_conversion(self):
         self.assertEqual(unit_conversion('km', 'm'), (1000., 0.))
 
@@ -289,6 +316,94 @@ class TestModuleFunctions(unittest.TestCase):
         else:
             self.fail("Expecting Key Error")
 
+    def test_parse_unit_expr(self):
+        table = {'m': _find_unit('m'), 's': _find_unit('s'), 'K': _find_unit('K'),
+                 'W': _find_unit('W')}
+
+        for expr in ['m/s**2', '(m/s)**2', 'm**-2', '(m**2)**0.5', '1/(s*m)', '-2*m', '2*-3*s',
+                     'W/(m**2*K**-4)', '1.e3 * m', '5./9.*K']:
+            expected = eval(expr, {'__builtins__': None}, table)
+            result = _parse_unit_expr(expr, table)
+            self.assertEqual(repr(result), repr(expected), expr)
+
+        self.assertAlmostEqual(_parse_unit_expr('pi/180', {}, {'pi': 3.14159}), 3.14159 / 180)
+
+        with self.assertRaises(NameError):
+            _parse_unit_expr('m/foo', table)
+
+        # anything outside the unit grammar is rejected rather than evaluated as Python
+        for expr in ['m/', 'm s', '(m', 'm)', 'm+m', '[m]', '().__class__.__name__']:
+            with self.assertRaises(SyntaxError):
+                _parse_unit_expr(expr, table)
+
+        with self.assertRaises(SyntaxError):
+            add_unit('bad_unit', '().__class__')
+
+    def test_prefixed_units(self):
+        self.assertAlmostEqual(_find_unit('mm/ks')._factor, 1e-6)
+        self.assertAlmostEqual(_find_unit('Mibyte')._factor, _find_unit('byte')._factor * 2**20)
+        self.assertEqual(_find_unit('km*arc_minute').name(), 'km*arc_minute')
+        self.assertIsNone(_find_unit('xq/s'))
+
+    def test_unit_cache_spellings(self):
+        unit = _find_unit('kg * m / s**2')
+        self.assertIs(_find_unit('kg*m/s**2'), unit)
+        self.assertIs(_find_unit(' kg*m / s ** 2 '), unit)
+        self.assertIs(_UNIT_CACHE['kg*m/s**2'], unit)
+
+        # a unit's name is not cached as a unit string, so lookups don't depend on call order
+        self.assertEqual(_find_unit('m/m').name(), '1')
+        self.assertIsNone(_find_unit('1'))
+        self.assertFalse(valid_units('1'))
+        _find_unit('2*m/m')
+        self.assertIsNone(_find_unit('2'))
+
+        # whitespace between names is not an operator
+        with self.assertRaises(SyntaxError):
+            _find_unit('m s')
+
+    def test_convert_array(self):
+        val = np.array([0., 100., 212.])
+
+        np.testing.assert_allclose(convert_units(val, 'degF', 'degC'), [-160. / 9., 340. / 9., 100.])
+        np.testing.assert_allclose(convert_units(val, 'ft', 'inch'), [0., 1200., 2544.])
+
+        # the input array is left unchanged
+        np.testing.assert_array_equal(val, [0., 100., 212.])
+
+    def test_conversion_cache(self):
+        conversion = unit_conversion('ft', 'inch')
+        self.assertIs(_CONVERSION_CACHE['ft', 'inch'], conversion)
+        self.assertIs(unit_conversion('ft', 'inch'), conversion)
+        self.assertAlmostEqual(convert_units(2.0, 'ft', 'inch'), 24.0)
+
+        # replacing the library invalidates the cached conversions
+        with open(os.path.join(os.path.dirname(__file__),
+                               '../unit_library.ini')) as default_lib:
+            import_library(default_lib)
+
+        self.assertNotIn(('ft', 'inch'), _CONVERSION_CACHE)
+        self.assertEqual(unit_conversion('ft', 'inch'), conversion)
+
+    def test_update_library_order(self):
+        # definitions may refer to units that appear later in the file
+        update_library(StringIO("[units]\n"
+                                "quux: 3*qux, a test unit\n"
+                                "degQ: 2.0, qux, 1.0, an offset test unit\n"
+                                "qux: 2*bar, another test unit\n"))
+
+        self.assertAlmostEqual(convert_units(1.0, 'quux', 'bar'), 6.0)
+        self.assertEqual(_find_unit('degQ')._offset, 1.0)
+
+        msg = "The following units were not defined because they could not be resolved " \
+              "as a function of any other defined units:['circ1', 'circ2', 'circ3']"
+        with self.assertRaises(ValueError) as cm:
+            update_library(StringIO("[units]\n"
+                                    "circ1: 2*xyzzy, unknown dependency\n"
+                                    "circ2: 2*circ3, circular\n"
+                                    "circ3: 2*circ2, circular\n"))
+        self.assertEqual(str(cm.exception), msg)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,17 +9,16 @@ in Scientific Python, by Konrad Hinsen. Modifications by
 Justin Gray.
 """
 
-import sys
-
 import re
+import sys
 import os.path
-from collections import OrderedDict
+from collections import deque
 
 from configparser import RawConfigParser as ConfigParser
 from openmdao.utils.general_utils import warn_deprecation
 
 # pylint: disable=E0611, F0401
-from math import floor, pi
+from math import pi
 
 import numpy as np
 
@@ -29,7 +28,7 @@ import numpy as np
 ####################################
 
 
-class NumberDict(OrderedDict):
+class NumberDict(dict):
     """
     Dictionary storing numerical values.
 
@@ -40,42 +39,21 @@ class NumberDict(OrderedDict):
     and division by scalars.
     """
 
-    def __getitem__(self, item):
+    def __missing__(self, item):
         """
-        Get the item, or 0.
+        Return 0 for undefined entries.
 
         Parameters
         ----------
         item : key
-            key to get the item
+            key that is not in the dict
 
         Returns
         -------
         int
-            value of the given key
-        """
-        try:
-            return dict.__getitem__(self, item)
-        except KeyError:
-            return 0
-
-    def __coerce__(self, other):
+            0
         """
-        Change other dict to NumberDicts.
-
-        Parameters
-        ----------
-        other : Dict
-            the dict instance to be coerced
-
-        Returns
-        -------
-        NumberDict
-            new NumberDict with keys/values from original
-        """
-        if isinstance(other, dict):
-            other = NumberDict(other)
-        return self, other
+        return 0
 
     def __add__(self, other):
         """
@@ -91,11 +69,10 @@ class NumberDict(OrderedDict):
         NumberDict
             new NumberDict with self+other values
         """
-        sum_dict = NumberDict()
-        for k, v in self.items():
-            sum_dict[k] = v
+        sum_dict = NumberDict(self)
+        get = sum_dict.get
         for k, v in other.items():
-            sum_dict[k] = sum_dict[k] + v
+            sum_dict[k] = get(k, 0) + v
         return sum_dict
 
     def __sub__(self, other):
@@ -112,11 +89,10 @@ class NumberDict(OrderedDict):
         NumberDict
             new NumberDict instance, with self-other values
         """
-        sum_dict = NumberDict()
-        for k, v in self.items():
-            sum_dict[k] = v
+        sum_dict = NumberDict(self)
+        get = sum_dict.get
         for k, v in other.items():
-            sum_dict[k] = sum_dict[k] - v
+            sum_dict[k] = get(k, 0) - v
         return sum_dict
 
     def __rsub__(self, other):
@@ -133,11 +109,10 @@ class NumberDict(OrderedDict):
         NumberDict
             new NumberDict instance, with other-self values
         """
-        sum_dict = NumberDict()
-        for k, v in other.items():
-            sum_dict[k] = v
+        sum_dict = NumberDict(other)
+        get = sum_dict.get
         for k, v in self.items():
-            sum_dict[k] = sum_dict[k] - v
+            sum_dict[k] = get(k, 0) - v
         return sum_dict
 
     def __mul__(self, other):
@@ -154,14 +129,11 @@ class NumberDict(OrderedDict):
         NumberDict
             new NumberDict instance, with other*self values
         """
-        new = NumberDict()
-        for key, value in self.items():
-            new[key] = other * value
-        return new
+        return NumberDict((key, other * value) for key, value in self.items())
 
     __rmul__ = __mul__
 
-    def __div__(self, other):
+    def __truediv__(self, other):
         """
         Divide myself by another NumberDict.
 
@@ -175,12 +147,7 @@ class NumberDict(OrderedDict):
         NumberDict
             new NumberDict instance, with self/other values
         """
-        new = NumberDict()
-        for key, value in self.items():
-            new[key] = value / other
-        return new
-
-    __truediv__ = __div__  # for python 3
+        return NumberDict((key, value / other) for key, value in self.items())
 
     def __repr__(self):
         """
@@ -216,12 +183,21 @@ class PhysicalUnit(object):
         which is assigned an implicit power 1.
     _factor : float
         A scaling factor.
-    _powers : list of int
+    _powers : tuple of int
         The integer powers for each of the nine base units.
     _offset : float
         An additive offset to the base unit (used only for temperatures)
+    _base_unit : PhysicalUnit or None
+        The base unit equivalent of this unit, computed on first request.
+    _dimensionless : bool or None
+        Whether this unit is dimensionless, computed on first request.
+    _angle : bool or None
+        Whether this unit is an angle, computed on first request.
     """
 
+    __slots__ = ('_names', '_factor', '_powers', '_offset', '_base_unit', '_dimensionless',
+                 '_angle')
+
     def __init__(self, names, factor, powers, offset=0):
         """
         Initialize all attributes.
@@ -235,7 +211,7 @@ class PhysicalUnit(object):
             which is assigned an implicit power 1.
         factor : float
             A scaling factor.
-        powers : list of int
+        powers : list or tuple of int
             The integer powers for each of the nine base units.
         offset : float
             An additive offset to the base unit (used only for temperatures).
@@ -247,7 +223,12 @@ class PhysicalUnit(object):
 
         self._factor = float(factor)
         self._offset = float(offset)
-        self._powers = powers
+        self._powers = _intern_powers(tuple(powers))
+
+        # _powers is never modified, so these are only computed once, when first needed.
+        self._base_unit = None
+        self._dimensionless = None
+        self._angle = None
 
     def __repr__(self):
         """
@@ -259,7 +240,7 @@ class PhysicalUnit(object):
             str representation of how to instantiate this PhysicalUnit
         """
         return 'PhysicalUnit(%s,%s,%s,%s)' % (self._names, self._factor,
-                                              self._powers, self._offset)
+                                              list(self._powers), self._offset)
 
     def __str__(self):
         """
@@ -327,6 +308,17 @@ class PhysicalUnit(object):
                 self._offset == other._offset and
                 self._powers == other._powers)
 
+    def __hash__(self):
+        """
+        Compute a hash consistent with __eq__.
+
+        Returns
+        -------
+        int
+            hash of the factor, offset, and powers of this unit
+        """
+        return hash((self._factor, self._offset, self._powers))
+
     def __mul__(self, other):
         """
         Multiply myself by other.
@@ -347,7 +339,7 @@ class PhysicalUnit(object):
         if isinstance(other, PhysicalUnit):
             return PhysicalUnit(self._names + other._names,
                                 self._factor * other._factor,
-                                [a + b for a, b in zip(self._powers, other._powers)])
+                                tuple(a + b for a, b in zip(self._powers, other._powers)))
         else:
             return PhysicalUnit(self._names + {str(other): 1},
                                 self._factor * other,
@@ -356,7 +348,7 @@ class PhysicalUnit(object):
 
     __rmul__ = __mul__
 
-    def __div__(self, other):
+    def __truediv__(self, other):
         """
         Divide myself by other.
 
@@ -376,15 +368,13 @@ class PhysicalUnit(object):
         if isinstance(other, PhysicalUnit):
             return PhysicalUnit(self._names - other._names,
                                 self._factor / other._factor,
-                                [a - b for (a, b) in zip(self._powers,
-                                                         other._powers)])
+                                tuple(a - b for (a, b) in zip(self._powers,
+                                                              other._powers)))
         else:
             return PhysicalUnit(self._names + {str(other): -1},
                                 self._factor / float(other), self._powers)
 
-    __truediv__ = __div__   # for python 3
-
-    def __rdiv__(self, other):
+    def __rtruediv__(self, other):
         """
         Divide other by myself.
 
@@ -400,9 +390,7 @@ class PhysicalUnit(object):
         """
         return PhysicalUnit({str(other): 1} - self._names,
                             float(other) / self._factor,
-                            [-x for x in self._powers])
-
-    __rtruediv__ = __rdiv__
+                            tuple(-x for x in self._powers))
 
     def __pow__(self, other):
         """
@@ -422,24 +410,22 @@ class PhysicalUnit(object):
             raise TypeError("cannot exponentiate units with non-zero offset")
         if isinstance(other, int):
             return PhysicalUnit(other * self._names, pow(self._factor, other),
-                                [x * other for x in self._powers])
+                                tuple(x * other for x in self._powers))
         if isinstance(other, float):
             inv_exp = 1. / other
-            rounded = int(floor(inv_exp + 0.5))
-            if abs(inv_exp - rounded) < 1.e-10:
-
-                if all([x % rounded == 0 for x in self._powers]):
-                    f = self._factor**other
-                    p = [x / rounded for x in self._powers]
-                    if all([x % rounded == 0 for x in self._names.values()]):
-                        names = self._names / rounded
-                    else:
-                        names = NumberDict()
-                        if f != 1.:
-                            names[str(f)] = 1
-                        for x, name in zip(p, _UNIT_LIB.base_names):
-                            names[name] = x
-                    return PhysicalUnit(names, f, p)
+            rounded = round(inv_exp)
+            if abs(inv_exp - rounded) < 1.e-10 and all(x % rounded == 0 for x in self._powers):
+                f = self._factor**other
+                p = tuple(x // rounded for x in self._powers)
+                if all(x % rounded == 0 for x in self._names.values()):
+                    names = self._names / rounded
+                else:
+                    names = NumberDict()
+                    if f != 1.:
+                        names[str(f)] = 1
+                    for x, name in zip(p, _UNIT_LIB.base_names):
+                        names[name] = x
+                return PhysicalUnit(names, f, p)
 
         raise TypeError('Only integer and inverse integer exponents allowed')
 
@@ -452,24 +438,11 @@ class PhysicalUnit(object):
         PhysicalUnit
             the equivalent base unit
         """
-        num = ''
-        denom = ''
-        for unit, power in zip(_UNIT_LIB.base_names, self._powers):
-            if power < 0:
-                denom = denom + '/' + unit
-                if power < -1:
-                    denom = denom + '**' + str(-power)
-            elif power > 0:
-                num = num + '*' + unit
-                if power > 1:
-                    num = num + '**' + str(power)
-
-        if len(num) == 0:
-            num = '1'
-        else:
-            num = num[1:]
+        if self._base_unit is not None:
+            return self._base_unit
 
-        return _find_unit(num + denom)
+        self._base_unit = _find_unit(_unit_name(zip(_UNIT_LIB.base_names, self._powers)))
+        return self._base_unit
 
     def conversion_tuple_to(self, other):
         """
@@ -505,6 +478,11 @@ class PhysicalUnit(object):
         # thus, D = d1 - d2*s2/s1 and S = s1/s2
 
         factor = self._factor / other._factor
+
+        # only a few units (e.g. temperatures) have an offset
+        if self._offset == 0 and other._offset == 0:
+            return (factor, 0.0)
+
         offset = self._offset - (other._offset * other._factor / self._factor)
         return (factor, offset)
 
@@ -533,7 +511,9 @@ class PhysicalUnit(object):
         bool
             indicates if this is dimensionless
         """
-        return not any(self._powers)
+        if self._dimensionless is None:
+            self._dimensionless = not any(self._powers)
+        return self._dimensionless
 
     def is_angle(self):
         """
@@ -544,8 +524,10 @@ class PhysicalUnit(object):
         bool
             indicates if this an angle type
         """
-        return (self._powers[_UNIT_LIB.base_types['angle']] == 1 and
-                sum(self._powers) == 1)
+        if self._angle is None:
+            self._angle = (self._powers[_UNIT_LIB.base_types['angle']] == 1 and
+                           sum(self._powers) == 1)
+        return self._angle
 
     def set_name(self, name):
         """
@@ -568,28 +550,171 @@ class PhysicalUnit(object):
         str
             str representation of the unit
         """
-        num = ''
-        denom = ''
-        for unit, power in self._names.items():
-            if power < 0:
-                denom = denom + '/' + unit
-                if power < -1:
-                    denom = denom + '**' + str(-power)
-            elif power > 0:
-                num = num + '*' + unit
-                if power > 1:
-                    num = num + '**' + str(power)
-        if len(num) == 0:
-            num = '1'
-        else:
-            num = num[1:]
-        return num + denom
+        return _unit_name(self._names.items())
 
 
 ####################################
 # Module Functions
 ####################################
 
+
+def _unit_name(terms):
+    """
+    Build the name of a unit from its terms, e.g. 'kg*m/s**2'.
+
+    Parameters
+    ----------
+    terms : iter of (str, int or float)
+        Names and powers of the terms in the unit.
+
+    Returns
+    -------
+    str
+        The unit name, with the terms of positive power in the numerator.
+    """
+    num = []
+    denom = []
+    for unit, power in terms:
+        if power > 0:
+            num.append(unit if power == 1 else f'{unit}**{power}')
+        elif power < 0:
+            denom.append(unit if power == -1 else f'{unit}**{-power}')
+
+    name = '*'.join(num) or '1'
+    if denom:
+        return name + '/' + '/'.join(denom)
+    return name
+
+
+# Tokens of a unit expression: numbers, names, and the operators *, /, **, unary +/- and parens.
+_EXPR_TOKEN_RE = re.compile(r'\s*(?:(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)|'
+                            r'([A-Za-z_]\w*)|(\*\*|[-+*/()]))')
+
+
+def _tokenize_unit_expr(expr):
+    """
+    Split a unit expression into tokens.
+
+    Parameters
+    ----------
+    expr : str
+        The unit expression, e.g. 'kg*m/s**2'.
+
+    Returns
+    -------
+    list of (str, object)
+        The (kind, value) of each token, where kind is 'num', 'name' or 'op'.
+    """
+    tokens = []
+    pos = 0
+    end = len(expr.rstrip())
+    while pos < end:
+        match = _EXPR_TOKEN_RE.match(expr, pos)
+        if match is None:
+            raise SyntaxError("invalid unit expression '%s'" % expr)
+
+        num, name, op = match.groups()
+        if num is not None:
+            if num.isdigit():
+                tokens.append(('num', int(num)))
+            else:
+                tokens.append(('num', float(num)))
+        elif name is not None:
+            tokens.append(('name', name))
+        else:
+            tokens.append(('op', op))
+
+        pos = match.end()
+
+    return tokens
+
+
+def _parse_unit_expr(expr, unit_table, constants=None):
+    """
+    Evaluate a unit expression without using eval.
+
+    The grammar and precedence are the subset of Python's used by unit expressions:
+    products and quotients of powers, where '**' binds tighter than unary minus on its
+    left and takes a signed operand on its right.
+
+    Parameters
+    ----------
+    expr : str
+        The unit expression, e.g. 'kg*m/s**2'.
+    unit_table : dict
+        Mapping of unit names to PhysicalUnit instances.
+    constants : dict or None
+        Additional named values, e.g. {'pi': pi}, looked up after unit_table.
+
+    Returns
+    -------
+    PhysicalUnit or float or int
+        The value of the expression.
+    """
+    tokens = _tokenize_unit_expr(expr)
+    ntokens = len(tokens)
+
+    def peek_op(pos):
+        if pos < ntokens and tokens[pos][0] == 'op':
+            return tokens[pos][1]
+
+    def parse_atom(pos):
+        if pos >= ntokens:
+            raise SyntaxError("invalid unit expression '%s'" % expr)
+
+        kind, value = tokens[pos]
+        if kind == 'num':
+            return pos + 1, value
+        if kind == 'name':
+            try:
+                return pos + 1, unit_table[value]
+            except KeyError:
+                if constants and value in constants:
+                    return pos + 1, constants[value]
+                raise NameError("name '%s' is not defined" % value)
+        if value == '(':
+            pos, result = parse_product(pos + 1)
+            if peek_op(pos) != ')':
+                raise SyntaxError("invalid unit expression '%s'" % expr)
+            return pos + 1, result
+
+        raise SyntaxError("invalid unit expression '%s'" % expr)
+
+    def parse_power(pos):
+        pos, result = parse_atom(pos)
+        if peek_op(pos) == '**':
+            pos, exponent = parse_unary(pos + 1)
+            result = result ** exponent
+        return pos, result
+
+    def parse_unary(pos):
+        op = peek_op(pos)
+        if op == '-':
+            pos, result = parse_unary(pos + 1)
+            return pos, -result
+        if op == '+':
+            return parse_unary(pos + 1)
+        return parse_power(pos)
+
+    def parse_product(pos):
+        pos, result = parse_unary(pos)
+        op = peek_op(pos)
+        while op == '*' or op == '/':
+            pos, rhs = parse_unary(pos + 1)
+            if op == '*':
+                result = result * rhs
+            else:
+                result = result / rhs
+            op = peek_op(pos)
+        return pos, result
+
+    pos, result = parse_product(0)
+    if pos != ntokens:
+        raise SyntaxError("invalid unit expression '%s'" % expr)
+
+    return result
+
+
 def _new_unit(name, factor, powers):
     """
     Create new Unit.
@@ -600,7 +725,7 @@ def _new_unit(name, factor, powers):
         The name of the new unit
     factor : float
         conversion factor to base units
-    powers : [int, ...]
+    powers : [int, ...] or (int, ...)
         power of base units
 
     """
@@ -658,8 +783,7 @@ def add_unit(name, unit, comment=''):
     if comment:
         _UNIT_LIB.help.append((name, comment, unit))
     if isinstance(unit, str):
-        unit = eval(unit, {'__builtins__': None, 'pi': pi},
-                    _UNIT_LIB.unit_table)
+        unit = _parse_unit_expr(unit, _UNIT_LIB.unit_table, {'pi': pi})
     unit.set_name(name)
     if name in _UNIT_LIB.unit_table:
         if (_UNIT_LIB.unit_table[name]._factor != unit._factor or
@@ -712,16 +836,13 @@ def import_library(libfilepointer):
         newly updated units library for the module
     """
     global _UNIT_LIB
-    global _UNIT_CACHE
-    _UNIT_CACHE = {}
+    _UNIT_CACHE.clear()
+    _POWERS_INTERN.clear()
+    _clear_conversion_caches()
     _UNIT_LIB = ConfigParser()
     _UNIT_LIB.optionxform = _do_nothing
 
-    # New in Python 3.2: read_file() replaces readfp().
-    if sys.version_info >= (3, 2):
-        _UNIT_LIB.read_file(libfilepointer)
-    else:
-        _UNIT_LIB.readfp(libfilepointer)
+    _UNIT_LIB.read_file(libfilepointer)
 
     required_base_types = ['length', 'mass', 'time', 'temperature', 'angle']
     _UNIT_LIB.base_names = list()
@@ -735,6 +856,8 @@ def import_library(libfilepointer):
         factor, comma, comment = factor.partition(',')
         _UNIT_LIB.prefixes[prefix] = float(factor)
 
+    _UNIT_LIB.prefix_lengths = sorted({len(prefix) for prefix in _UNIT_LIB.prefixes})
+
     base_list = [0] * len(_UNIT_LIB.items('base_units'))
 
     for i, (unit_type, name) in enumerate(_UNIT_LIB.items('base_units')):
@@ -767,19 +890,15 @@ def update_library(filename):
     filename : string or file
         Source of units configuration data.
     """
-    if isinstance(filename, basestring):
-        inp = open(filename, 'rU')
+    if isinstance(filename, str):
+        inp = open(filename, 'r')
     else:
         inp = filename
     try:
         cfg = ConfigParser()
         cfg.optionxform = _do_nothing
 
-        # New in Python 3.2: read_file() replaces readfp().
-        if sys.version_info >= (3, 2):
-            cfg.read_file(inp)
-        else:
-            cfg.readfp(inp)
+        cfg.read_file(inp)
 
         _update_library(cfg)
     finally:
@@ -795,55 +914,128 @@ def _update_library(cfg):
     cfg : ConfigParser
         ConfigParser loaded with unit_lib.ini data
     """
-    retry1 = set()
+    _clear_conversion_caches()
+
+    # Parse every definition once, noting which other units in cfg it refers to.
+    defs = {}
     for name, unit in cfg.items('units'):
         data = [item.strip() for item in unit.split(',')]
         if len(data) == 2:
-            unit, comment = data
-            try:
-                add_unit(name, unit, comment)
-            except NameError:
-                retry1.add((name, unit, comment))
+            expr, comment = data
+            defs[name] = (expr, comment)
         elif len(data) == 4:
-            factor, baseunit, offset, comment = data
-            try:
-                add_offset_unit(name, baseunit, float(factor), float(offset),
-                                comment)
-            except NameError:
-                retry1.add((name, baseunit, float(factor), float(offset),
-                            comment))
+            factor, expr, offset, comment = data
+            defs[name] = (expr, float(factor), float(offset), comment)
         else:
             raise ValueError('Unit %r definition %r has invalid format',
                              name, unit)
-    retry_count = 0
-    last_retry_count = -1
-    while last_retry_count != retry_count and retry1:
-        last_retry_count = retry_count
-        retry_count = 0
-        retry2 = retry1.copy()
-        for data in retry2:
-            if len(data) == 3:
-                name, unit, comment = data
-                try:
-                    add_unit(name, unit, comment)
-                    retry1.remove(data)
-                except NameError:
-                    retry_count += 1
+
+    dependents = {name: [] for name in defs}
+    indegree = dict.fromkeys(defs, 0)
+    for name, data in defs.items():
+        try:
+            tokens = _tokenize_unit_expr(data[0])
+        except SyntaxError:
+            # let add_unit report it, in file order
+            continue
+        for dep in {value for kind, value in tokens if kind == 'name'}:
+            if dep in dependents and dep != name:
+                dependents[dep].append(name)
+                indegree[name] += 1
+
+    # Add the units in dependency order (Kahn's algorithm), keeping file order otherwise.
+    ready = deque(name for name, count in indegree.items() if count == 0)
+    unresolved = []
+    while ready:
+        name = ready.popleft()
+        data = defs[name]
+        try:
+            if len(data) == 2:
+                expr, comment = data
+                add_unit(name, expr, comment)
             else:
-                try:
-                    name, factor, baseunit, offset, comment = data
-                    add_offset_unit(name, factor, baseunit, offset, comment)
-                    retry1.remove(data)
-                except NameError:
-                    retry_count += 1
-    if retry1:
+                baseunit, factor, offset, comment = data
+                add_offset_unit(name, baseunit, factor, offset, comment)
+        except NameError:
+            unresolved.append(name)
+
+        for dependent in dependents[name]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+
+    # Anything left over is part of a circular definition.
+    unresolved.extend(name for name, count in indegree.items() if count > 0)
+
+    if unresolved:
         raise ValueError('The following units were not defined because they'
                          ' could not be resolved as a function of any other'
-                         ' defined units:%s' % [x[0] for x in retry1])
+                         ' defined units:%s' % unresolved)
 
 
 _UNIT_CACHE = {}
 
+# A unit name starts with a letter, and the remaining characters may include numbers.
+_UNIT_NAME_RE = re.compile(r'[A-Za-z]\w*')
+
+# Whitespace around operators and parentheses, which doesn't change the meaning of a unit.
+_OP_SPACE_RE = re.compile(r'\s*([*/()])\s*')
+
+# Caches of results derived from unit strings, so repeated conversions skip _find_unit.
+_CONVERSION_CACHE = {}
+_COMPATIBLE_CACHE = {}
+_BASE_CONVERSION_CACHE = {}
+
+
+# Shared _powers tuples, so units with the same dimensions compare by identity.
+_POWERS_INTERN = {}
+
+
+def _intern_powers(powers):
+    """
+    Return the shared instance of the given tuple of base unit powers.
+
+    Parameters
+    ----------
+    powers : tuple of int
+        The powers of the base units.
+
+    Returns
+    -------
+    tuple of int
+        A tuple equal to powers, shared by all units with these dimensions.
+    """
+    return _POWERS_INTERN.setdefault(powers, powers)
+
+
+def _intern_str(string):
+    """
+    Return the interned copy of a cache key string.
+
+    Keys that are interned when they are stored let later lookups with interned strings,
+    such as unit names written as literals, match by identity.
+
+    Parameters
+    ----------
+    string : str
+        The key string.
+
+    Returns
+    -------
+    str
+        The interned string.
+    """
+    return sys.intern(str(string))
+
+
+def _clear_conversion_caches():
+    """
+    Clear the caches of conversion results, which depend on the current unit library.
+    """
+    _CONVERSION_CACHE.clear()
+    _COMPATIBLE_CACHE.clear()
+    _BASE_CONVERSION_CACHE.clear()
+
 
 def _find_unit(unit):
     """
@@ -860,51 +1052,54 @@ def _find_unit(unit):
         The actual unit object
     """
     if isinstance(unit, str):
-        name = unit.strip()
+        unit_str = unit
+        try:
+            unit = _UNIT_CACHE[unit_str]
+        except KeyError:
+            pass
+        else:
+            return unit if isinstance(unit, PhysicalUnit) else None
+
+        # equivalent spellings that differ only in whitespace share a cache entry
+        name = sys.intern(_OP_SPACE_RE.sub(r'\1', unit_str.strip()))
         try:
             unit = _UNIT_CACHE[name]
         except KeyError:
             try:
-                unit = eval(name, {'__builtins__': None}, _UNIT_LIB.unit_table)
+                unit = _parse_unit_expr(name, _UNIT_LIB.unit_table)
             except Exception:
 
                 # This unit might include prefixed units that aren't in the
                 # unit_table. We must parse them ALL and add them to the
                 # unit_table.
 
-                # First character of a unit is always alphabet or $.
-                # Remaining characters may include numbers.
-                regex = re.compile('[A-Z,a-z]{1}[A-Z,a-z,0-9]*')
+                unit_table = _UNIT_LIB.unit_table
+                prefixes = _UNIT_LIB.prefixes
 
-                for item in regex.findall(name):
+                for item in _UNIT_NAME_RE.findall(name):
                     # check if this was a compound unit, so each
                     # substring might be a unit
-                    try:
-                        eval(item, {'__builtins__': None},
-                             _UNIT_LIB.unit_table)
-                    except Exception:  # maybe is a prefixed unit then
-                        # check for single letter prefix before unit
-                        if(item[0] in _UNIT_LIB.prefixes and
-                           item[1:] in _UNIT_LIB.unit_table):
-                            add_unit(item, _UNIT_LIB.prefixes[item[0]] *
-                                     _UNIT_LIB.unit_table[item[1:]])
-
-                        # check for double letter prefix before unit
-                        elif(item[0:2] in _UNIT_LIB.prefixes and
-                             item[2:] in _UNIT_LIB.unit_table):
-                            add_unit(item, _UNIT_LIB.prefixes[item[0:2]] *
-                                     _UNIT_LIB.unit_table[item[2:]])
-
-                        # no prefixes found, unknown unit
-                        else:
-                            return None
-                            # raise ValueError("no unit named '%s' is defined"
-                            #                  % item)
-
-                unit = eval(name, {'__builtins__': None}, _UNIT_LIB.unit_table)
+                    if item in unit_table:
+                        continue
+
+                    # maybe is a prefixed unit then, so check the shortest prefixes first
+                    for nchar in _UNIT_LIB.prefix_lengths:
+                        prefix = item[:nchar]
+                        base = item[nchar:]
+                        if prefix in prefixes and base in unit_table:
+                            add_unit(item, prefixes[prefix] * unit_table[base])
+                            break
+
+                    # no prefixes found, unknown unit
+                    else:
+                        return None
+
+                unit = _parse_unit_expr(name, _UNIT_LIB.unit_table)
 
             _UNIT_CACHE[name] = unit
 
+        _UNIT_CACHE[_intern_str(unit_str)] = unit
+
     if not isinstance(unit, PhysicalUnit):
         return None
 
@@ -946,9 +1141,16 @@ def conversion_to_base_units(units):
     """
     if not units:  # dimensionless
         return 0., 1.
+
+    try:
+        return _BASE_CONVERSION_CACHE[units]
+    except KeyError:
+        pass
+
     unit = _find_unit(units)
 
-    return unit._offset, unit._factor
+    _BASE_CONVERSION_CACHE[_intern_str(units)] = result = (unit._offset, unit._factor)
+    return result
 
 
 def is_compatible(old_units, new_units):
@@ -972,10 +1174,20 @@ def is_compatible(old_units, new_units):
     if not old_units and not new_units:  # dimensionless
         return True
 
+    if old_units == new_units:
+        return True
+
+    try:
+        return _COMPATIBLE_CACHE[old_units, new_units]
+    except KeyError:
+        pass
+
     old_unit = _find_unit(old_units)
     new_unit = _find_unit(new_units)
 
-    return old_unit.is_compatible(new_unit)
+    key = (_intern_str(old_units), _intern_str(new_units))
+    _COMPATIBLE_CACHE[key] = compatible = old_unit.is_compatible(new_unit)
+    return compatible
 
 
 def unit_conversion(old_units, new_units):
@@ -994,11 +1206,18 @@ def unit_conversion(old_units, new_units):
     (float, float)
         Conversion factor and offset
     """
+    try:
+        return _CONVERSION_CACHE[old_units, new_units]
+    except KeyError:
+        pass
+
     new_physical_units = _find_unit(new_units)
     if new_physical_units is None:
         raise RuntimeError("Cannot convert to new units: %s" % str(new_units))
 
-    return _find_unit(old_units).conversion_tuple_to(new_physical_units)
+    conversion = _find_unit(old_units).conversion_tuple_to(new_physical_units)
+    _CONVERSION_CACHE[_intern_str(old_units), _intern_str(new_units)] = conversion
+    return conversion
 
 
 def get_conversion(old_units, new_units):
@@ -1029,7 +1248,7 @@ def convert_units(val, old_units, new_units=None):
 
     Parameters
     ----------
-    val : float
+    val : float or ndarray
         value in original units.
     old_units : str or None
         original units as a string or None.
@@ -1038,19 +1257,33 @@ def convert_units(val, old_units, new_units=None):
 
     Returns
     -------
-    float
+    float or ndarray
         value in new units.
     """
     if not old_units or not new_units:  # one side has no units
         return val
 
-    old_unit = _find_unit(old_units)
-    if new_units:
+    if old_units == new_units:
+        return val
+
+    try:
+        factor, offset = _CONVERSION_CACHE[old_units, new_units]
+    except KeyError:
+        old_unit = _find_unit(old_units)
         new_unit = _find_unit(new_units)
-    else:
-        new_unit = old_unit.in_base_units()
 
-    (factor, offset) = old_unit.conversion_tuple_to(new_unit)
+        factor, offset = old_unit.conversion_tuple_to(new_unit)
+        _CONVERSION_CACHE[_intern_str(old_units), _intern_str(new_units)] = (factor, offset)
+
+    if offset == 0.:
+        return val * factor
+
+    if isinstance(val, np.ndarray):
+        # scale the shifted copy in place rather than allocating a second temporary
+        val = val + offset
+        val *= factor
+        return val
+
     return (val + offset) * factor
 
 